@@ -5,13 +5,33 @@ Fetches content from all live website pages and creates a comprehensive,
 well-structured llms.txt file for LLM consumption.
 """
 
+import gzip
+import hashlib
+import json
+import logging
+import os
 import re
+import sys
 import urllib.request
 import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from html import unescape
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
 
 
+logger = logging.getLogger(__name__)
+
+# Fetched pages are kept here with their validators so reruns only re-download
+# pages that changed on the server
+CACHE_DIR = Path(__file__).parent.parent / ".cache" / "llms_txt"
+
+# Responses declaring any other Content-Type skip the HTML extraction pipeline
+HTML_CONTENT_TYPES = frozenset({"text/html", "application/xhtml+xml"})
+
+# Content-Encoding values (normalised to lowercase) that mean a gzip body
+GZIP_CONTENT_ENCODINGS = frozenset({"gzip", "x-gzip"})
+
 # Page configuration with descriptions
 PAGES = {
     "overview": {
@@ -47,54 +67,237 @@ PAGES = {
 }
 
 
+HEAD_END_RE = re.compile(r"</head\s*>", re.IGNORECASE)
+BODY_START_RE = re.compile(r"<body[\s>]", re.IGNORECASE)
+
+# Elements that never contribute page text, stripped with one alternation per
+# group instead of one full pass per tag. Scripts and styles go first so that a
+# closing tag inside a script string cannot end an enclosing chrome element.
+SCRIPT_ELEMENTS_RE = re.compile(
+    r"<(script|style)[^>]*>.*?</\1>", re.DOTALL | re.IGNORECASE
+)
+CHROME_ELEMENTS_RE = re.compile(
+    r"<(svg|nav|footer|header)[^>]*>.*?</\1>", re.DOTALL | re.IGNORECASE
+)
+
+# Main content areas, in priority order - common Astro/React patterns. The
+# fallback patterns are paired with lowercase literals of which at least one
+# must appear in the page for them to match, so those that cannot match are
+# skipped with a substring check instead of a backtracking regex scan. The
+# <main> and <article> searches are cheap and usually hit, so they run as is.
+MAIN_CONTENT_PATTERNS = [
+    (re.compile(pattern, re.DOTALL | re.IGNORECASE), required)
+    for pattern, required in (
+        (r"<main[^>]*>(.*?)</main>", ()),
+        (r"<article[^>]*>(.*?)</article>", ()),
+        (
+            r'<div[^>]*class="[^"]*(?:_content|_main|prose|markdown|docs)[^"]*"[^>]*>(.*?)</div>',
+            ("_content", "_main", "prose", "markdown", "docs"),
+        ),
+        (
+            r'<div[^>]*id="[^"]*(?:content|main)[^"]*"[^>]*>(.*?)</div>',
+            ("content", "main"),
+        ),
+        (
+            r'<section[^>]*class="[^"]*(?:content|main)[^"]*"[^>]*>(.*?)</section>',
+            ("<section",),
+        ),
+    )
+]
+
+TAG_RE = re.compile(r"<[^>]+>")
+HORIZONTAL_SPACE_RE = re.compile(r"[ \t]+")
+WHITESPACE_RE = re.compile(r"\s+")
+
+# Common navigation/header text that appears in Astro sites
+NAV_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+    for pattern in (
+        r"Overview\s+Specification\s+Reference\s+Acceptance\s+Tests\s+Governance\s+Changelog",
+        r"Skip\s+to\s+content",
+        r"Menu\s+Close",
+        r"^\s*Open\s+Responses\s*$",
+        r"^\s*Overview\s*$",
+        r"^\s*Specification\s*$",
+        r"^\s*Reference\s*$",
+        r"^\s*Acceptance\s+Tests\s*$",
+        r"^\s*Governance\s*$",
+        r"^\s*Changelog\s*$",
+    )
+]
+DUPLICATE_TITLE_RE = re.compile(r"Open\s+Responses\s+Open\s+Responses")
+LEADING_PAGE_TITLE_RE = re.compile(
+    r"^(Overview|Specification|Reference|Acceptance Tests|Governance|Changelog)\s+",
+    re.IGNORECASE,
+)
+
+# Concept patterns with their names, in output order
+CONCEPT_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), name)
+    for pattern, name in (
+        (
+            r"Items?\s+(?:are|is)\s+(?:the\s+)?(?:fundamental|core|basic|atomic)\s+(?:unit|building)\s+of[^.\n]{10,150}",
+            "Items",
+        ),
+        (r"Agentic\s+[Ll]oop[^.\n]{0,20}(?:[^.\n]{0,200})", "Agentic Loop"),
+        (
+            r"Semantic\s+(?:streaming|events)[^.\n]{0,20}(?:[^.\n]{0,200})",
+            "Semantic Streaming",
+        ),
+        (r"State\s+[Mm]achines?[^.\n]{0,20}(?:[^.\n]{0,200})", "State Machines"),
+        (r"Multi[-\s]?provider[^.\n]{0,20}(?:[^.\n]{0,200})", "Multi-Provider"),
+    )
+]
+
+# HTTP endpoints, typed parameters (backtick followed by type) and streaming events
+ENDPOINT_RE = re.compile(r"(POST|GET|PUT|DELETE|PATCH)\s+(/[\w\-/.:]+)")
+TYPED_PARAMETER_RE = re.compile(
+    r"`(\w+)`\s*[:\(]\s*(string|number|integer|boolean|array|object)", re.IGNORECASE
+)
+EVENT_PREFIX = "response."
+EVENT_NAME_RE = re.compile(r"response\.[\w.]+")
+
+# Common API parameter names, found by whole word in a single scan
+COMMON_PARAMETERS = [
+    "model",
+    "input",
+    "tools",
+    "tool_choice",
+    "stream",
+    "temperature",
+    "top_p",
+    "max_tokens",
+    "truncation",
+    "service_tier",
+    "reasoning",
+]
+COMMON_PARAMETER_RE = re.compile(
+    r"\b(" + "|".join(COMMON_PARAMETERS) + r")\b", re.IGNORECASE
+)
+
+LINK_RE = re.compile(r"\[.+\]\(.+\)")
+
+
+def _cache_path(url: str) -> Path:
+    return CACHE_DIR / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+
+
+def _read_cache(url: str) -> dict[str, str] | None:
+    """Return the cached entry for a URL, or None if it is missing or malformed"""
+    try:
+        entry = json.loads(_cache_path(url).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict):
+        return None
+    if not all(
+        isinstance(entry.get(key), str)
+        for key in ("etag", "last_modified", "content")
+    ):
+        return None
+    if not (entry["etag"] or entry["last_modified"]):
+        return None
+    return entry
+
+
+def _write_cache(url: str, entry: dict[str, str]) -> None:
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _cache_path(url).write_text(json.dumps(entry), encoding="utf-8")
+    except OSError as e:
+        logger.warning("  [WARN] Could not cache %s: %s", url, e)
+
+
 def fetch_web_content(url: str) -> str:
-    """Fetch content from a URL with error handling"""
+    """Fetch content from a URL with error handling.
+
+    Pages are requested gzip-compressed. Responses declaring a non-HTML
+    Content-Type are skipped without downloading the body. HTML responses
+    carrying an ETag or Last-Modified header are cached on disk and revalidated
+    with a conditional request, so unchanged pages are not downloaded again.
+    """
+    headers = {
+        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.5",
+        "Accept-Encoding": "gzip",
+    }
+    cached = _read_cache(url)
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
     try:
-        req = urllib.request.Request(
-            url,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.5",
-            },
-        )
+        req = urllib.request.Request(url, headers=headers)
         with urllib.request.urlopen(req, timeout=30) as response:
-            return response.read().decode("utf-8")
+            # Pages served without a Content-Type are still treated as HTML
+            content_type = response.headers.get_content_type()
+            if (
+                "Content-Type" in response.headers
+                and content_type not in HTML_CONTENT_TYPES
+            ):
+                logger.warning(
+                    "  [WARN] Skipping %s: expected HTML, got %s", url, content_type
+                )
+                return ""
+            body = response.read()
+            encoding = response.headers.get("Content-Encoding", "").strip().lower()
+            if encoding in GZIP_CONTENT_ENCODINGS:
+                body = gzip.decompress(body)
+            content = body.decode("utf-8")
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            _write_cache(
+                url,
+                {
+                    "etag": etag or "",
+                    "last_modified": last_modified or "",
+                    "content": content,
+                },
+            )
+        return content
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and cached:
+            return cached["content"]
+        logger.warning("  [WARN] Error fetching %s: %s", url, e)
+        return ""
     except urllib.error.URLError as e:
-        print(f"  [WARN] Error fetching {url}: {e}")
+        logger.warning("  [WARN] Error fetching %s: %s", url, e)
         return ""
     except Exception as e:
-        print(f"  [WARN] Unexpected error fetching {url}: {e}")
+        logger.warning("  [WARN] Unexpected error fetching %s: %s", url, e)
         return ""
 
 
 def extract_main_content(html: str) -> str:
     """Extract main content area from HTML, removing nav/footer/scripts"""
-    # Remove script and style tags completely
-    html = re.sub(
-        r"<script[^>]*>.*?</script>", "", html, flags=re.DOTALL | re.IGNORECASE
-    )
-    html = re.sub(r"<style[^>]*>.*?</style>", "", html, flags=re.DOTALL | re.IGNORECASE)
-    html = re.sub(r"<svg[^>]*>.*?</svg>", "", html, flags=re.DOTALL | re.IGNORECASE)
-    html = re.sub(r"<nav[^>]*>.*?</nav>", "", html, flags=re.DOTALL | re.IGNORECASE)
-    html = re.sub(
-        r"<footer[^>]*>.*?</footer>", "", html, flags=re.DOTALL | re.IGNORECASE
-    )
-    html = re.sub(
-        r"<header[^>]*>.*?</header>", "", html, flags=re.DOTALL | re.IGNORECASE
-    )
-
-    # Try to find main content area - common Astro/React patterns
-    main_patterns = [
-        r"<main[^>]*>(.*?)</main>",
-        r"<article[^>]*>(.*?)</article>",
-        r'<div[^>]*class="[^"]*(?:_content|_main|prose|markdown|docs)[^"]*"[^>]*>(.*?)</div>',
-        r'<div[^>]*id="[^"]*(?:content|main)[^"]*"[^>]*>(.*?)</div>',
-        r'<section[^>]*class="[^"]*(?:content|main)[^"]*"[^>]*>(.*?)</section>',
-    ]
-
-    for pattern in main_patterns:
-        match = re.search(pattern, html, re.DOTALL | re.IGNORECASE)
+    # Skip the document head, which holds no page text but is often the bulk
+    # of the markup (inline styles, scripts and metadata). The body is only
+    # looked for after the head ends, so a "<body" literal inside a head script
+    # cannot start the slice mid-script.
+    head_end = HEAD_END_RE.search(html)
+    if head_end:
+        body_start = BODY_START_RE.search(html, head_end.end())
+        if body_start:
+            html = html[body_start.start() :]
+
+    # Remove script, style and page chrome elements completely
+    html = SCRIPT_ELEMENTS_RE.sub("", html)
+    html = CHROME_ELEMENTS_RE.sub("", html)
+
+    # Try to find main content area
+    lowered = None
+    for pattern, required in MAIN_CONTENT_PATTERNS:
+        if required:
+            # Lowercase copy made only once a fallback pattern is reached
+            if lowered is None:
+                lowered = html.lower()
+            if not any(literal in lowered for literal in required):
+                continue
+        match = pattern.search(html)
         if match:
             html = match.group(1)
             break
@@ -105,29 +308,15 @@ def extract_main_content(html: str) -> str:
 def clean_html_to_text(html: str) -> str:
     """Convert HTML to clean text"""
     # Remove remaining HTML tags
-    text = re.sub(r"<[^>]+>", " ", html)
-
-    # Decode HTML entities
-    entities = {
-        "&lt;": "<",
-        "&gt;": ">",
-        "&amp;": "&",
-        "&quot;": '"',
-        "&apos;": "'",
-        "&#39;": "'",
-        "&nbsp;": " ",
-        "&ndash;": "–",
-        "&mdash;": "—",
-        "&hellip;": "…",
-    }
-    for entity, char in entities.items():
-        text = text.replace(entity, char)
+    text = TAG_RE.sub(" ", html)
+
+    # Decode HTML entities in a single pass, keeping non-breaking spaces plain
+    text = unescape(text).replace("\xa0", " ")
 
-    # Clean up whitespace
-    text = re.sub(r"\n\s*\n", "\n\n", text)
-    text = re.sub(r"[ \t]+", " ", text)
+    # Collapse runs of spaces and tabs
+    text = HORIZONTAL_SPACE_RE.sub(" ", text)
 
-    # Remove excessive blank lines
+    # Strip each line and collapse runs of blank lines into one
     lines = text.split("\n")
     cleaned = []
     prev_blank = False
@@ -143,51 +332,39 @@ def clean_html_to_text(html: str) -> str:
     return "\n".join(cleaned).strip()
 
 
+def fetch_page_text(url: str) -> str | None:
+    """Fetch a page and reduce it to its main content text.
+
+    Returns None if the page could not be fetched. The HTML is processed once
+    and dropped, so only the much smaller text outlives this call.
+    """
+    html = fetch_web_content(url)
+    if not html:
+        return None
+    return clean_html_to_text(extract_main_content(html))
+
+
 def extract_first_paragraph(text: str, max_chars: int = 300) -> str:
     """Extract the first meaningful paragraph from text, filtering out nav/header cruft"""
-    # Remove common navigation/header text that appears in Astro sites
-    nav_patterns = [
-        r"Overview\s+Specification\s+Reference\s+Acceptance\s+Tests\s+Governance\s+Changelog",
-        r"Skip\s+to\s+content",
-        r"Menu\s+Close",
-        r"^\s*Open\s+Responses\s*$",
-        r"^\s*Overview\s*$",
-        r"^\s*Specification\s*$",
-        r"^\s*Reference\s*$",
-        r"^\s*Acceptance\s+Tests\s*$",
-        r"^\s*Governance\s*$",
-        r"^\s*Changelog\s*$",
-    ]
-    for pattern in nav_patterns:
-        text = re.sub(pattern, "", text, flags=re.IGNORECASE | re.MULTILINE)
+    # Remove common navigation/header text
+    for pattern in NAV_PATTERNS:
+        text = pattern.sub("", text)
 
     # Remove duplicate "Open Responses Open Responses" patterns
-    text = re.sub(r"Open\s+Responses\s+Open\s+Responses", "Open Responses", text)
+    text = DUPLICATE_TITLE_RE.sub("Open Responses", text)
 
     paragraphs = text.split("\n\n")
     for para in paragraphs:
         para = para.strip()
-        # Skip if too short or looks like a heading/code/navigation
+        # Skip if too short (including bare navigation labels) or a heading/code
         if len(para) < 40:
             continue
         if para.startswith("#") or para.startswith("```"):
             continue
-        # Skip if it looks like navigation or metadata
-        if re.match(
-            r"^(Overview|Specification|Reference|Acceptance|Tests|Governance|Changelog|Menu|Close|Skip|Open Responses)\s*$",
-            para,
-            re.IGNORECASE,
-        ):
-            continue
         # Clean up excessive whitespace
-        para = re.sub(r"\s+", " ", para)
+        para = WHITESPACE_RE.sub(" ", para)
         # Remove leading page titles (e.g., "Specification Open Responses is...")
-        para = re.sub(
-            r"^(Overview|Specification|Reference|Acceptance Tests|Governance|Changelog)\s+",
-            "",
-            para,
-            flags=re.IGNORECASE,
-        )
+        para = LEADING_PAGE_TITLE_RE.sub("", para)
         # Return first substantial paragraph, truncated
         if len(para) > max_chars:
             para = para[:max_chars].rsplit(" ", 1)[0] + "..."
@@ -195,53 +372,16 @@ def extract_first_paragraph(text: str, max_chars: int = 300) -> str:
     return ""
 
 
-def extract_section_content(
-    text: str, section_patterns: List[str], max_chars: int = 500
-) -> str:
-    """Extract content from specific sections by heading patterns"""
-    for pattern in section_patterns:
-        # Look for heading followed by content
-        match = re.search(
-            pattern + r"[:\s]*\n+(.+?)(?:\n#|\n\n#|$)",
-            text,
-            re.IGNORECASE | re.DOTALL,
-        )
-        if match:
-            content = match.group(1).strip()
-            # Clean up the content
-            content = re.sub(r"\n+", " ", content)
-            content = re.sub(r"\s+", " ", content)
-            if len(content) > max_chars:
-                content = content[:max_chars].rsplit(" ", 1)[0] + "..."
-            return content
-    return ""
-
-
-def extract_key_concepts(text: str) -> List[str]:
+def extract_key_concepts(text: str) -> list[str]:
     """Extract key concepts from specification text"""
     concepts = []
 
-    # Define concept patterns with their descriptions
-    concept_patterns = [
-        (
-            r"Items?\s+(?:are|is)\s+(?:the\s+)?(?:fundamental|core|basic|atomic)\s+(?:unit|building)\s+of[^.\n]{10,150}",
-            "Items",
-        ),
-        (r"Agentic\s+[Ll]oop[^.\n]{0,20}(?:[^.\n]{0,200})", "Agentic Loop"),
-        (
-            r"Semantic\s+(?:streaming|events)[^.\n]{0,20}(?:[^.\n]{0,200})",
-            "Semantic Streaming",
-        ),
-        (r"State\s+[Mm]achines?[^.\n]{0,20}(?:[^.\n]{0,200})", "State Machines"),
-        (r"Multi[-\s]?provider[^.\n]{0,20}(?:[^.\n]{0,200})", "Multi-Provider"),
-    ]
-
     seen = set()
-    for pattern, name in concept_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        for match in matches[:2]:  # Limit matches per pattern
+    for pattern, name in CONCEPT_PATTERNS:
+        # Limit matches per pattern, without scanning past them
+        for match in islice(pattern.finditer(text), 2):
             # Clean up the match
-            clean = re.sub(r"\s+", " ", match.strip())
+            clean = WHITESPACE_RE.sub(" ", match.group().strip())
             if len(clean) > 30 and clean.lower() not in seen:
                 # Capitalize first letter
                 clean = clean[0].upper() + clean[1:] if clean else clean
@@ -258,9 +398,8 @@ def extract_key_concepts(text: str) -> List[str]:
             "State Machines define valid states and transitions for objects in the API such as in_progress, completed, or failed",
             "Multi-Provider support allows one schema to map cleanly to many model providers while maintaining semantic consistency",
         ]
-        existing = {c.lower() for c in concepts}
         for concept in fallback:
-            if concept.lower() not in existing:
+            if concept.lower() not in seen:
                 concepts.append(concept)
                 if len(concepts) >= 5:
                     break
@@ -268,73 +407,82 @@ def extract_key_concepts(text: str) -> List[str]:
     return concepts[:5]
 
 
-def extract_api_info(text: str) -> Tuple[List[str], List[str], List[str]]:
-    """Extract endpoints, parameters, and streaming events from text"""
+def extract_api_info(
+    text: str, max_endpoints: int = 8, max_parameters: int = 15, max_events: int = 12
+) -> tuple[list[str], list[str], list[str]]:
+    """Extract endpoints, parameters, and streaming events from text.
+
+    Each scan stops as soon as its category reaches its limit.
+    """
     endpoints = []
     parameters = []
     events = []
 
     # Extract HTTP endpoints
-    endpoint_pattern = r"(POST|GET|PUT|DELETE|PATCH)\s+(/[\w\-/.:]+)"
     seen_endpoints = set()
-    for method, path in re.findall(endpoint_pattern, text):
-        endpoint = f"{method} {path}"
+    for match in ENDPOINT_RE.finditer(text):
+        if len(endpoints) >= max_endpoints:
+            break
+        endpoint = f"{match.group(1)} {match.group(2)}"
         if endpoint.lower() not in seen_endpoints:
             endpoints.append(endpoint)
             seen_endpoints.add(endpoint.lower())
 
     # Extract parameter-like patterns (backtick followed by type)
-    param_pattern = r"`(\w+)`\s*[:\(]\s*(string|number|integer|boolean|array|object)"
     seen_params = set()
-    for name, ptype in re.findall(param_pattern, text, re.IGNORECASE):
+    for match in TYPED_PARAMETER_RE.finditer(text):
+        if len(parameters) >= max_parameters:
+            break
+        name, ptype = match.groups()
         if name.lower() not in seen_params and len(name) > 2:
             parameters.append(f"{name} ({ptype})")
             seen_params.add(name.lower())
 
     # Also look for common API parameter names
-    common_params = [
-        "model",
-        "input",
-        "tools",
-        "tool_choice",
-        "stream",
-        "temperature",
-        "top_p",
-        "max_tokens",
-        "truncation",
-        "service_tier",
-        "reasoning",
-    ]
-    for param in common_params:
-        if param.lower() not in seen_params and re.search(
-            rf"\b{param}\b", text, re.IGNORECASE
-        ):
-            parameters.append(param)
-            seen_params.add(param.lower())
-
-    # Extract streaming events
-    event_pattern = r"`?(response\.[\w_\.]+)`?"
+    if len(parameters) < max_parameters:
+        mentioned = {name.lower() for name in COMMON_PARAMETER_RE.findall(text)}
+        for param in COMMON_PARAMETERS:
+            if len(parameters) >= max_parameters:
+                break
+            if param.lower() not in seen_params and param in mentioned:
+                parameters.append(param)
+                seen_params.add(param.lower())
+
+    # Extract streaming events. Every event name starts with the same literal,
+    # so jump between its occurrences with str.find and only run the regex at
+    # those positions instead of scanning the whole text with it.
     seen_events = set()
-    for event in re.findall(event_pattern, text):
+    start = text.find(EVENT_PREFIX)
+    while start != -1 and len(events) < max_events:
+        match = EVENT_NAME_RE.match(text, start)
+        if not match:
+            start = text.find(EVENT_PREFIX, start + 1)
+            continue
+        event = match.group()
         if event.lower() not in seen_events:
             events.append(event)
             seen_events.add(event.lower())
+        start = text.find(EVENT_PREFIX, match.end())
 
-    return endpoints[:8], parameters[:15], events[:12]
+    return endpoints, parameters, events
 
 
-def validate_llms_txt(file_path: str) -> Tuple[bool, Dict]:
-    """Validate llms.txt against llmstxt.org specification"""
+def validate_llms_txt(file_path: str) -> tuple[bool, dict]:
+    """Validate an llms.txt file against llmstxt.org specification"""
     with open(file_path, "r", encoding="utf-8") as f:
-        content = f.read()
+        return validate_llms_content(f.read())
 
+
+def validate_llms_content(content: str) -> tuple[bool, dict]:
+    """Validate llms.txt content against llmstxt.org specification"""
     lines = content.split("\n")
 
     results = {
         "h1_found": any(line.startswith("# ") for line in lines),
         "blockquote_found": any(line.startswith("> ") for line in lines),
         "h2_count": sum(1 for line in lines if line.startswith("## ")),
-        "links_found": any(re.search(r"\[.+\]\(.+\)", line) for line in lines),
+        # "." never matches a newline, so one search finds links within a line
+        "links_found": LINK_RE.search(content) is not None,
         "file_size": len(content),
         "line_count": len(lines),
     }
@@ -349,26 +497,37 @@ def validate_llms_txt(file_path: str) -> Tuple[bool, Dict]:
 def generate_llms_txt(output_path: str) -> bool:
     """Generate comprehensive llms.txt from all website pages"""
 
-    print("Fetching documentation from live website...\n")
+    logger.info("Fetching documentation from live website...\n")
+
+    # Fetch all pages concurrently; the run is dominated by network round trips,
+    # and each page is extracted while the others are still downloading
+    with ThreadPoolExecutor(max_workers=len(PAGES)) as executor:
+        pages_text = dict(
+            zip(
+                PAGES,
+                executor.map(
+                    fetch_page_text, [info["url"] for info in PAGES.values()]
+                ),
+            )
+        )
 
-    # Fetch all pages
     page_contents = {}
     for key, info in PAGES.items():
-        print(f"  Fetching {info['title']}...")
-        html = fetch_web_content(info["url"])
-        if html:
-            main_html = extract_main_content(html)
-            text = clean_html_to_text(main_html)
+        logger.info("  %s...", info["title"])
+        text = pages_text[key]
+        if text is not None:
             page_contents[key] = {
                 "text": text,
                 "info": info,
             }
-            print(f"    [OK] Extracted {len(text)} characters")
+            logger.info("    [OK] Extracted %d characters", len(text))
         else:
-            print(f"    [FAIL] Failed to fetch")
+            logger.error(
+                "    [FAIL] Failed to fetch %s (%s)", info["title"], info["url"]
+            )
             page_contents[key] = None
 
-    print("\nGenerating llms.txt content...")
+    logger.info("\nGenerating llms.txt content...")
 
     # Build llms.txt content
     content = []
@@ -463,19 +622,25 @@ def generate_llms_txt(output_path: str) -> bool:
     with open(output_path, "w", encoding="utf-8") as f:
         f.write(output_text)
 
-    print(f"\n[OK] Generated llms.txt ({len(output_text)} bytes, {len(content)} lines)")
+    logger.info(
+        "\n[OK] Generated llms.txt (%d bytes, %d lines)", len(output_text), len(content)
+    )
 
-    # Validate
-    is_valid, results = validate_llms_txt(output_path)
+    # Validate what was just written, without reading the file back
+    is_valid, results = validate_llms_content(output_text)
 
-    print("\n[RESULT] Validation Results:")
-    print(f"  - H1 heading: {'[OK]' if results['h1_found'] else '[FAIL]'}")
-    print(f"  - Blockquote: {'[OK]' if results['blockquote_found'] else '[FAIL]'}")
-    print(
-        f"  - H2 sections: {results['h2_count']} {'[OK]' if results['h2_count'] >= 1 else '[FAIL]'}"
+    logger.info("\n[RESULT] Validation Results:")
+    logger.info("  - H1 heading: %s", "[OK]" if results["h1_found"] else "[FAIL]")
+    logger.info(
+        "  - Blockquote: %s", "[OK]" if results["blockquote_found"] else "[FAIL]"
     )
-    print(f"  - Links found: {'[OK]' if results['links_found'] else '[FAIL]'}")
-    print(f"  - Overall: {'[OK] VALID' if is_valid else '[FAIL] INVALID'}")
+    logger.info(
+        "  - H2 sections: %d %s",
+        results["h2_count"],
+        "[OK]" if results["h2_count"] >= 1 else "[FAIL]",
+    )
+    logger.info("  - Links found: %s", "[OK]" if results["links_found"] else "[FAIL]")
+    logger.info("  - Overall: %s", "[OK] VALID" if is_valid else "[FAIL] INVALID")
 
     if not is_valid:
         raise ValueError("Generated llms.txt does not meet llmstxt.org specification")
@@ -483,31 +648,48 @@ def generate_llms_txt(output_path: str) -> bool:
     return is_valid
 
 
+def parse_log_level(value: str) -> int | None:
+    """Resolve a LOG_LEVEL value (a level name or number) to a logging level"""
+    value = value.strip()
+    if value.isdigit():
+        return int(value)
+    return logging.getLevelNamesMapping().get(value.upper())
+
+
 def main():
     """Main entry point"""
+    requested_level = os.environ.get("LOG_LEVEL", "INFO")
+    level = parse_log_level(requested_level)
+    # Progress goes to stdout, as it did when this script printed it directly
+    logging.basicConfig(
+        level=logging.INFO if level is None else level,
+        format="%(message)s",
+        stream=sys.stdout,
+    )
+    if level is None:
+        logger.warning(
+            "[WARN] Unknown LOG_LEVEL %r, falling back to INFO", requested_level
+        )
     project_root = Path(__file__).parent.parent
     output_path = project_root / "public" / "llms.txt"
 
     # Ensure public directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    print("=" * 60)
-    print("[GEN] OpenResponses llms.txt Generator")
-    print("=" * 60)
-    print()
+    logger.info("=" * 60)
+    logger.info("[GEN] OpenResponses llms.txt Generator")
+    logger.info("=" * 60)
+    logger.info("")
 
     try:
         success = generate_llms_txt(str(output_path))
         if success:
-            print(f"\n[SUCCESS] Success! File written to: {output_path}")
+            logger.info("\n[SUCCESS] Success! File written to: %s", output_path)
         else:
-            print("\n[WARN]  Warning: Validation failed")
+            logger.warning("\n[WARN]  Warning: Validation failed")
             return 1
     except Exception as e:
-        print(f"\n[FAIL] Error: {e}")
-        import traceback
-
-        traceback.print_exc()
+        logger.exception("\n[FAIL] Error: %s", e)
         return 1
 
     return 0
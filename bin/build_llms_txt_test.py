@@ -0,0 +1,250 @@
+import gzip
+import json
+import logging
+import sys
+import tempfile
+import unittest
+import urllib.error
+from email.message import Message
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import build_llms_txt
+from build_llms_txt import (
+    _cache_path,
+    clean_html_to_text,
+    extract_api_info,
+    extract_main_content,
+    fetch_web_content,
+    parse_log_level,
+    validate_llms_content,
+)
+
+URL = "https://www.openresponses.org/specification"
+
+
+def _response(body: bytes, headers: dict[str, str]) -> mock.MagicMock:
+    message = Message()
+    for name, value in headers.items():
+        message[name] = value
+    response = mock.MagicMock()
+    response.__enter__.return_value = response
+    response.headers = message
+    response.read.return_value = body
+    return response
+
+
+class ExtractMainContentTests(unittest.TestCase):
+    def test_strips_non_content_elements_before_locating_main(self) -> None:
+        html = (
+            "<html><head><script>var s = '<main>decoy</main>';</script>"
+            "<STYLE>p { color: red; }</STYLE></head><body>"
+            "<header><nav>Overview Specification</nav></header>"
+            "<main><svg><path d='M0'/></svg><p>Body text</p></main>"
+            "<footer>Footer</footer></body></html>"
+        )
+
+        self.assertEqual(extract_main_content(html), "<p>Body text</p>")
+
+    def test_closing_tag_inside_a_script_does_not_end_page_chrome(self) -> None:
+        html = '<nav><script>s="</nav>"</script>Menu</nav><p>Body text</p>'
+
+        self.assertEqual(extract_main_content(html), "<p>Body text</p>")
+
+    def test_ignores_document_head_when_no_main_area_is_found(self) -> None:
+        html = (
+            "<html><head><title>Page title</title></head>"
+            "<body class='page'><p>Body text</p></body></html>"
+        )
+
+        self.assertEqual(
+            extract_main_content(html),
+            "<body class='page'><p>Body text</p></body></html>",
+        )
+
+    def test_body_literal_inside_a_head_script_does_not_start_the_body(self) -> None:
+        html = (
+            "<html><head><script>document.write('<body>');</script></head>"
+            "<body><p>Body text</p></body></html>"
+        )
+
+        self.assertEqual(
+            extract_main_content(html), "<body><p>Body text</p></body></html>"
+        )
+
+
+class CleanHtmlToTextTests(unittest.TestCase):
+    def test_decodes_entities_and_collapses_blank_lines(self) -> None:
+        html = (
+            "<p>It&rsquo;s&nbsp;here</p>\n  \n\n \t\n"
+            "<p>Next   &#x27;line&#x27;</p>\n"
+        )
+
+        self.assertEqual(clean_html_to_text(html), "It\u2019s here\n\nNext 'line'")
+
+
+class FetchWebContentTests(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        patcher = mock.patch.object(build_llms_txt, "CACHE_DIR", Path(directory.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _urlopen(self, *results: object) -> mock.MagicMock:
+        patcher = mock.patch.object(
+            build_llms_txt.urllib.request, "urlopen", side_effect=list(results)
+        )
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
+    def test_caches_responses_that_carry_validators(self) -> None:
+        self._urlopen(
+            _response(
+                b"<p>Spec</p>",
+                {"Content-Type": "text/html; charset=utf-8", "ETag": '"v1"'},
+            )
+        )
+
+        self.assertEqual(fetch_web_content(URL), "<p>Spec</p>")
+        self.assertEqual(
+            json.loads(_cache_path(URL).read_text(encoding="utf-8")),
+            {"etag": '"v1"', "last_modified": "", "content": "<p>Spec</p>"},
+        )
+
+    def test_not_modified_returns_the_cached_body(self) -> None:
+        _cache_path(URL).write_text(
+            json.dumps({"etag": '"v1"', "last_modified": "", "content": "<p>Old</p>"}),
+            encoding="utf-8",
+        )
+        urlopen = self._urlopen(
+            urllib.error.HTTPError(URL, 304, "Not Modified", Message(), None)
+        )
+
+        self.assertEqual(fetch_web_content(URL), "<p>Old</p>")
+        request = urlopen.call_args.args[0]
+        self.assertEqual(request.get_header("If-none-match"), '"v1"')
+
+    def test_malformed_cache_entries_fall_back_to_a_normal_fetch(self) -> None:
+        for entry in (["x"], {"etag": '"v1"', "last_modified": ""}, "{"):
+            with self.subTest(entry=entry):
+                text = entry if isinstance(entry, str) else json.dumps(entry)
+                _cache_path(URL).write_text(text, encoding="utf-8")
+                urlopen = self._urlopen(
+                    _response(b"<p>Fresh</p>", {"Content-Type": "text/html"})
+                )
+
+                self.assertEqual(fetch_web_content(URL), "<p>Fresh</p>")
+                request = urlopen.call_args.args[0]
+                self.assertIsNone(request.get_header("If-none-match"))
+
+    def test_skips_responses_declaring_a_non_html_content_type(self) -> None:
+        response = _response(
+            b'{"openapi": "3.1.0"}', {"Content-Type": "application/json"}
+        )
+        self._urlopen(response)
+
+        with self.assertLogs(build_llms_txt.logger, "WARNING"):
+            self.assertEqual(fetch_web_content(URL), "")
+        response.read.assert_not_called()
+
+    def test_treats_responses_without_a_content_type_as_html(self) -> None:
+        self._urlopen(_response(b"<p>Spec</p>", {}))
+
+        self.assertEqual(fetch_web_content(URL), "<p>Spec</p>")
+
+    def test_decompresses_gzip_bodies_whatever_the_encoding_spelling(self) -> None:
+        for encoding in ("gzip", " GZIP ", "x-gzip"):
+            with self.subTest(encoding=encoding):
+                self._urlopen(
+                    _response(
+                        gzip.compress("<p>Spéc</p>".encode("utf-8")),
+                        {"Content-Type": "text/html", "Content-Encoding": encoding},
+                    )
+                )
+
+                self.assertEqual(fetch_web_content(URL), "<p>Spéc</p>")
+
+
+class ExtractApiInfoTests(unittest.TestCase):
+    def test_collects_endpoints_parameters_and_events_in_order(self) -> None:
+        text = (
+            "POST /v1/responses creates a response. GET /v1/responses/{id} too.\n"
+            "`previous_response_id`: string links turns. Set Temperature or "
+            "TOOL_CHOICE; `tools` are listed, but tool_choices is not a field.\n"
+            "Events: `response.created`, response.output_text.delta and "
+            "`response.created` again."
+        )
+
+        endpoints, parameters, events = extract_api_info(text)
+
+        self.assertEqual(endpoints, ["POST /v1/responses", "GET /v1/responses/"])
+        self.assertEqual(
+            parameters,
+            ["previous_response_id (string)", "tools", "tool_choice", "temperature"],
+        )
+        self.assertEqual(events, ["response.created", "response.output_text.delta"])
+
+    def test_stops_each_category_at_its_limit(self) -> None:
+        text = " ".join(
+            f"GET /v1/items/{i} `field_{i}`: string response.event_{i}"
+            for i in range(30)
+        )
+
+        endpoints, parameters, events = extract_api_info(
+            text, max_endpoints=2, max_parameters=3, max_events=4
+        )
+
+        self.assertEqual(endpoints, ["GET /v1/items/0", "GET /v1/items/1"])
+        self.assertEqual(
+            parameters, ["field_0 (string)", "field_1 (string)", "field_2 (string)"]
+        )
+        self.assertEqual(
+            events,
+            [
+                "response.event_0",
+                "response.event_1",
+                "response.event_2",
+                "response.event_3",
+            ],
+        )
+
+
+class ValidateLlmsContentTests(unittest.TestCase):
+    def test_reports_structure_of_valid_content(self) -> None:
+        content = (
+            "# Open Responses\n\n> Summary\n\n## Documentation\n\n"
+            "- [Overview](https://www.openresponses.org/)\n\n## More\n"
+        )
+
+        is_valid, results = validate_llms_content(content)
+
+        self.assertTrue(is_valid)
+        self.assertEqual(results["h2_count"], 2)
+        self.assertTrue(results["links_found"])
+        self.assertEqual(results["file_size"], len(content))
+        self.assertEqual(results["line_count"], 10)
+
+    def test_requires_a_blockquote_summary(self) -> None:
+        is_valid, results = validate_llms_content("# Open Responses\n\n## Docs\n")
+
+        self.assertFalse(is_valid)
+        self.assertFalse(results["blockquote_found"])
+        self.assertFalse(results["links_found"])
+
+
+class ParseLogLevelTests(unittest.TestCase):
+    def test_accepts_level_names_and_numbers(self) -> None:
+        self.assertEqual(parse_log_level("warning"), logging.WARNING)
+        self.assertEqual(parse_log_level(" DEBUG "), logging.DEBUG)
+        self.assertEqual(parse_log_level("10"), 10)
+
+    def test_rejects_unknown_levels(self) -> None:
+        self.assertIsNone(parse_log_level("verbose"))
+        self.assertIsNone(parse_log_level(""))
+
+
+if __name__ == "__main__":
+    unittest.main()